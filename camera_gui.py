@@ -17,19 +17,52 @@ import sys
 import os
 import glob
 import socket
+import select
 import struct
 import uuid
 import time
 import threading
+import concurrent.futures
 import atexit
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import unescape
 import urllib.request
 import urllib.parse
 import re
 
+from rtsp_patterns import build_urls
+from config_yaml import save_yaml
+
 # Global list to track all ONVIF worker threads for cleanup
 _active_onvif_workers = []
 
+# Assets and the Frigate config live next to this script, whatever the
+# working directory is; the paths are resolved once rather than per call
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_ASSETS_DIR = os.path.join(_SCRIPT_DIR, "assets")
+_CONFIG_PATH = os.path.join(_SCRIPT_DIR, "frigate", "config", "config.yaml")
+
+# libyaml's C parser is several times faster than the pure-Python one; fall
+# back to SafeLoader when PyYAML was built without it.
+CLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# WS-Discovery / ONVIF responses are small and predictable, so the few fields
+# we need are pulled out with precompiled patterns instead of a full XML parse.
+# Tags may carry any namespace prefix (d:, wsdd:, tds:, ...).
+_XADDRS_RE = re.compile(r'<(?:[\w.-]+:)?XAddrs>([^<]*)<')
+_DEVICE_INFO_RE = re.compile(r'<(?:[\w.-]+:)?(Manufacturer|Model|FirmwareVersion)>([^<]*)<')
+_ONVIF_SCOPE_RES = (
+    re.compile(r'onvif://www\.onvif\.org/([^/\s]+)', re.IGNORECASE),
+    re.compile(r'http://[^/]*([^./]+)\.[^/]*/', re.IGNORECASE),
+)
+
+def _url_host(url):
+    """Return the host part of url, or None if it can't be parsed"""
+    try:
+        return urllib.parse.urlsplit(url).hostname
+    except ValueError:
+        return None
+
 def cleanup_all_threads():
     """Global cleanup function to ensure all threads are stopped"""
     global _active_onvif_workers
@@ -107,7 +140,13 @@ class ONVIFDiscoveryWorker(QThread):
         # Create multicast socket for WS-Discovery
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        sock.settimeout(5.0)
+        sock.setblocking(False)
+        discovered_ips = set()
+        # Replies that don't name the manufacturer need a GetDeviceInformation
+        # request; those run on pool threads so they can't hold up the replies
+        # still arriving
+        lookups = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        pending = []
         
         # WS-Discovery probe message for ONVIF devices
         probe_uuid = str(uuid.uuid4())
@@ -137,46 +176,72 @@ class ONVIFDiscoveryWorker(QThread):
             multicast_addr = ('239.255.255.250', 3702)
             sock.sendto(probe_message.encode('utf-8'), multicast_addr)
             
-            # Listen for responses
-            start_time = time.time()
-            discovered_ips = set()
+            # Listen for 3 seconds, reporting each camera as soon as it is
+            # identified. select() wakes at least every 0.2s to pass on
+            # finished lookups and to honour interruption requests.
+            deadline = time.monotonic() + 3.0
             
-            while time.time() - start_time < 3.0 and self.running and not self.isInterruptionRequested():  # 3 second timeout
+            while self.running and not self.isInterruptionRequested():
+                still_running = []
+                for future in pending:
+                    if future.done():
+                        self._report_camera(future.result(), cameras)
+                    else:
+                        still_running.append(future)
+                pending = still_running
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                readable, _, _ = select.select([sock], [], [], min(remaining, 0.2))
+                if not readable:
+                    continue
                 try:
-                    data, addr = sock.recvfrom(4096)
-                    ip_address = addr[0]
-                    
-                    # Check for interruption during processing
-                    if self.isInterruptionRequested():
-                        break
-                    
-                    if ip_address not in discovered_ips:
-                        discovered_ips.add(ip_address)
-                        
-                        # Extract camera info from response
-                        camera_info = self.parse_onvif_response(data.decode('utf-8', errors='ignore'), ip_address)
-                        if camera_info:
-                            cameras.append(camera_info)
-                            self.camera_found.emit(camera_info)
-                            self.progress_update.emit(f"📹 Found camera: {ip_address}")
-                        
-                except socket.timeout:
-                    # Check for interruption on timeout too
-                    if self.isInterruptionRequested():
-                        break
+                    data, addr = sock.recvfrom(65535)
+                except OSError:
                     continue
-                except Exception as e:
+                ip_address = addr[0]
+                if ip_address in discovered_ips:
                     continue
+                discovered_ips.add(ip_address)
+
+                # Extract camera info from response
+                camera_info = self.parse_onvif_response(data.decode('utf-8', errors='ignore'), ip_address)
+                if camera_info is None:
+                    continue
+                if camera_info['status'] == 'Identified':
+                    self._report_camera(camera_info, cameras)
+                else:
+                    pending.append(lookups.submit(self.add_onvif_device_info, camera_info))
                     
         except Exception as e:
             self.progress_update.emit(f"Network error: {str(e)}")
         finally:
             sock.close()
         
+        # Each lookup gives up after its 1 second timeout
+        for future in concurrent.futures.as_completed(pending):
+            # Check for interruption during processing
+            if self.isInterruptionRequested():
+                break
+            self._report_camera(future.result(), cameras)
+        lookups.shutdown(wait=False, cancel_futures=True)
+        
         return cameras
     
+    def _report_camera(self, camera_info, cameras):
+        """Add camera_info to cameras and announce it (None means it couldn't be read)"""
+        if camera_info:
+            cameras.append(camera_info)
+            self.camera_found.emit(camera_info)
+            self.progress_update.emit(f"📹 Found camera: {camera_info['ip']}")
+    
     def parse_onvif_response(self, response_data, ip_address):
-        """Parse ONVIF discovery response and extract camera info"""
+        """Parse ONVIF discovery response and extract camera info
+
+        Only the reply itself is read; if it doesn't name the manufacturer,
+        add_onvif_device_info asks the camera.
+        """
         try:
             # Basic camera info with defaults
             camera_info = {
@@ -189,6 +254,16 @@ class ONVIFDiscoveryWorker(QThread):
                 'status': 'Discovered'
             }
             
+            # Prefer the device service address the camera advertises for this IP
+            xaddrs = _XADDRS_RE.search(response_data)
+            if xaddrs:
+                for url in xaddrs.group(1).split():
+                    # Exact host match: a prefix test would let 192.168.1.1
+                    # take the address of 192.168.1.10
+                    if _url_host(url) == ip_address:
+                        camera_info['onvif_url'] = url
+                        break
+            
             # Method 1: Extract manufacturer from WS-Discovery response
             manufacturer = self.extract_manufacturer_from_discovery(response_data)
             if manufacturer and manufacturer != 'Unknown':
@@ -199,19 +274,27 @@ class ONVIFDiscoveryWorker(QThread):
                 rtsp_info = self.generate_manufacturer_rtsp_url(ip_address, manufacturer)
                 camera_info['rtsp_url'] = rtsp_info['default_url']
                 camera_info['rtsp_patterns'] = rtsp_info  # Store all patterns for later use
+            
+            return camera_info
+            
+        except Exception:
+            return None
+    
+    def add_onvif_device_info(self, camera_info):
+        """Fill in camera_info from ONVIF GetDeviceInformation (runs on a lookup thread)"""
+        try:
+            # Method 2: Try ONVIF GetDeviceInformation (in background)
+            ip_address = camera_info['ip']
+            device_info = self.get_onvif_device_info_quick(ip_address, camera_info['onvif_url'])
+            if device_info:
+                camera_info.update(device_info)
+                camera_info['status'] = 'Detailed'
                 
-            else:
-                # Method 2: Try ONVIF GetDeviceInformation (in background)
-                device_info = self.get_onvif_device_info_quick(ip_address)
-                if device_info:
-                    camera_info.update(device_info)
-                    camera_info['status'] = 'Detailed'
-                    
-                    # Generate manufacturer-specific RTSP URLs if manufacturer was found
-                    if 'manufacturer' in device_info and device_info['manufacturer'] != 'Unknown':
-                        rtsp_info = self.generate_manufacturer_rtsp_url(ip_address, device_info['manufacturer'])
-                        camera_info['rtsp_url'] = rtsp_info['default_url']
-                        camera_info['rtsp_patterns'] = rtsp_info
+                # Generate manufacturer-specific RTSP URLs if manufacturer was found
+                if 'manufacturer' in device_info and device_info['manufacturer'] != 'Unknown':
+                    rtsp_info = self.generate_manufacturer_rtsp_url(ip_address, device_info['manufacturer'])
+                    camera_info['rtsp_url'] = rtsp_info['default_url']
+                    camera_info['rtsp_patterns'] = rtsp_info
             
             return camera_info
             
@@ -246,33 +329,11 @@ class ONVIFDiscoveryWorker(QThread):
                     if pattern in response_lower:
                         return manufacturer.title()
             
-            # Method 2: Parse XML if present
-            if '<' in response_data and '>' in response_data:
-                try:
-                    start_tag = response_data.find('<')
-                    if start_tag >= 0:
-                        xml_data = response_data[start_tag:]
-                        root = ET.fromstring(xml_data)
-                        
-                        # Look for manufacturer info in XML elements
-                        for elem in root.iter():
-                            if elem.text:
-                                text = elem.text.lower()
-                                for manufacturer, patterns in manufacturer_patterns.items():
-                                    for pattern in patterns:
-                                        if pattern in text:
-                                            return manufacturer.title()
-                except ET.ParseError:
-                    pass
-            
-            # Method 3: Look for ONVIF scope patterns
-            scope_patterns = [
-                r'onvif://www\.onvif\.org/([^/\s]+)',
-                r'http://[^/]*([^./]+)\.[^/]*/'
-            ]
-            
-            for pattern in scope_patterns:
-                matches = re.findall(pattern, response_data, re.IGNORECASE)
+            # Method 2: Look for ONVIF scope patterns
+            # (element text is already covered by the full-text search above,
+            # so the response is never parsed as XML)
+            for pattern in _ONVIF_SCOPE_RES:
+                matches = pattern.findall(response_data)
                 for match in matches:
                     match_lower = match.lower()
                     for manufacturer, patterns in manufacturer_patterns.items():
@@ -285,7 +346,7 @@ class ONVIFDiscoveryWorker(QThread):
         except Exception:
             return 'Unknown'
     
-    def get_onvif_device_info_quick(self, ip_address):
+    def get_onvif_device_info_quick(self, ip_address, endpoint=None):
         """Get device info via ONVIF with short timeout for quick discovery"""
         try:
             soap_request = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -297,8 +358,9 @@ class ONVIFDiscoveryWorker(QThread):
     </soap:Body>
 </soap:Envelope>'''
             
-            # Try most common ONVIF endpoint with short timeout
-            endpoint = f'http://{ip_address}/onvif/device_service'
+            # Use the advertised endpoint, else the most common one, with short timeout
+            if not endpoint:
+                endpoint = f'http://{ip_address}/onvif/device_service'
             
             req = urllib.request.Request(
                 endpoint,
@@ -319,6 +381,20 @@ class ONVIFDiscoveryWorker(QThread):
     
     def parse_device_information_response(self, response_data):
         """Parse ONVIF GetDeviceInformation response"""
+        fields = {name: unescape(value.strip())
+                  for name, value in _DEVICE_INFO_RE.findall(response_data) if value.strip()}
+        if fields:
+            device_info = {}
+            if 'Manufacturer' in fields:
+                device_info['manufacturer'] = fields['Manufacturer']
+            if 'Model' in fields:
+                device_info['model'] = fields['Model']
+                if 'FirmwareVersion' in fields:
+                    device_info['name'] = f"{fields['Model']} (FW: {fields['FirmwareVersion']})"
+            if device_info:
+                return device_info
+        
+        # Fall back to a full XML parse for unusually formatted responses
         try:
             root = ET.fromstring(response_data)
             
@@ -353,96 +429,7 @@ class ONVIFDiscoveryWorker(QThread):
     
     def generate_manufacturer_rtsp_url(self, ip_address, manufacturer, username="admin", password="password"):
         """Generate manufacturer-specific RTSP URL patterns"""
-        try:
-            manufacturer_lower = manufacturer.lower()
-            
-            # Manufacturer-specific RTSP URL patterns
-            rtsp_patterns = {
-                'hikvision': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/Streaming/Channels/101',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/Streaming/Channels/102',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/h264/ch1/main/av_stream'
-                },
-                'dahua': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=1',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0'
-                },
-                'amcrest': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=1', 
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0'
-                },
-                'reolink': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/h264Preview_01_main',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/h264Preview_01_sub',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/h264Preview_01_main'
-                },
-                'axis': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/axis-media/media.amp',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/axis-media/media.amp?resolution=320x240',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/axis-media/media.amp'
-                },
-                'foscam': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/videoMain',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/videoSub',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/videoMain'
-                },
-                'vivotek': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/live.sdp',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/live2.sdp',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/live.sdp'
-                },
-                'bosch': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/rtsp_tunnel',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/rtsp_tunnel?inst=2',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/rtsp_tunnel'
-                },
-                'sony': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video1',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video2', 
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/media/video1'
-                },
-                'uniview': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video1',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video2',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/media/video1'
-                }
-            }
-            
-            # Check for exact manufacturer match
-            for mfr_key, patterns in rtsp_patterns.items():
-                if mfr_key in manufacturer_lower:
-                    return {
-                        'main_stream': patterns['main_stream'],
-                        'sub_stream': patterns['sub_stream'], 
-                        'default_url': patterns['default'],
-                        'manufacturer_detected': True
-                    }
-            
-            # Generic fallback for unknown manufacturers
-            generic_patterns = [
-                f'rtsp://{username}:{password}@{ip_address}:554/stream1',
-                f'rtsp://{username}:{password}@{ip_address}:554/live',
-                f'rtsp://{username}:{password}@{ip_address}:554/media/video1'
-            ]
-            
-            return {
-                'main_stream': generic_patterns[0],
-                'sub_stream': generic_patterns[0],
-                'default_url': generic_patterns[0],
-                'manufacturer_detected': False,
-                'alternatives': generic_patterns
-            }
-            
-        except Exception:
-            # Ultimate fallback
-            return {
-                'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/live',
-                'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/live',
-                'default_url': f'rtsp://{username}:{password}@{ip_address}:554/live',
-                'manufacturer_detected': False
-            }
+        return build_urls(ip_address, manufacturer, username, password)
     
     def stop_discovery(self):
         """Stop the discovery process"""
@@ -671,55 +658,6 @@ class ONVIFDiscoveryDialog(QDialog):
             print(f"Error during ONVIF dialog cleanup: {e}")
         event.accept()
 
-class MyDumper(yaml.Dumper):
-    """Custom YAML dumper for better formatting"""
-    def write_line_break(self, data=None):
-        super().write_line_break(data)
-        # add an extra line break for top-level keys
-        if len(self.indents) == 1:  
-            super().write_line_break()
-    
-    @staticmethod
-    def add_camera_spacing(yaml_content):
-        """Add extra spacing between camera entries in YAML content"""
-        lines = yaml_content.split('\n')
-        result_lines = []
-        in_cameras_section = False
-        camera_indent_level = None
-        
-        for i, line in enumerate(lines):
-            # Check if we're entering the cameras section
-            if line.strip() == 'cameras:' or line.rstrip().endswith('cameras:'):
-                in_cameras_section = True
-                camera_indent_level = None
-                result_lines.append(line)
-                continue
-            
-            # Check if we've left the cameras section (new top-level key)
-            if in_cameras_section and line and not line.startswith(' ') and not line.startswith('\t') and ':' in line:
-                in_cameras_section = False
-                camera_indent_level = None
-            
-            if in_cameras_section and line.strip():
-                # Determine camera entry indent level (first camera sets the pattern)
-                if camera_indent_level is None and line.startswith(' ') and ':' in line:
-                    camera_indent_level = len(line) - len(line.lstrip())
-                
-                # If this is a camera entry (same indent as first camera, has colon)
-                if (camera_indent_level is not None and 
-                    line.startswith(' ' * camera_indent_level) and 
-                    not line.startswith(' ' * (camera_indent_level + 1)) and
-                    ':' in line and
-                    line.strip().endswith(':')):
-                    
-                    # Add blank line before camera entry (except for the first one)
-                    if result_lines and result_lines[-1].strip():  # Don't add if previous line is already blank
-                        result_lines.append('')
-            
-            result_lines.append(line)
-        
-        return '\n'.join(result_lines)
-
 class CocoClassesDialog(QDialog):
     """Dialog to show available COCO classes - exact copy from config_gui.py"""
     def __init__(self, parent=None):
@@ -735,8 +673,7 @@ class CocoClassesDialog(QDialog):
         
         # Load and display classes
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            classes_path = os.path.join(script_dir, "assets", "coco-classes.txt")
+            classes_path = os.path.join(_ASSETS_DIR, "coco-classes.txt")
             with open(classes_path, 'r') as f:
                 self.text_area.setText(f.read())
         except Exception as e:
@@ -960,7 +897,7 @@ class SimpleCameraGUI(QWidget):
         
         # MemryX logo with blended styling
         memryx_logo = QLabel()
-        memryx_logo.setPixmap(QPixmap("assets/memryx.png").scaledToHeight(70, Qt.SmoothTransformation))
+        memryx_logo.setPixmap(QPixmap(os.path.join(_ASSETS_DIR, "memryx.png")).scaledToHeight(70, Qt.SmoothTransformation))
         memryx_logo.setStyleSheet("""
             QLabel {
                 background: rgba(255, 255, 255, 0.8);
@@ -980,7 +917,7 @@ class SimpleCameraGUI(QWidget):
         
         # Frigate logo with blended styling
         frigate_logo = QLabel()
-        frigate_logo.setPixmap(QPixmap("assets/frigate.png").scaledToHeight(70, Qt.SmoothTransformation))
+        frigate_logo.setPixmap(QPixmap(os.path.join(_ASSETS_DIR, "frigate.png")).scaledToHeight(70, Qt.SmoothTransformation))
         frigate_logo.setStyleSheet("""
             QLabel {
                 background: rgba(255, 255, 255, 0.8);
@@ -1345,103 +1282,11 @@ class SimpleCameraGUI(QWidget):
 
     def generate_manufacturer_rtsp_url(self, ip_address, manufacturer, username="admin", password="password"):
         """Generate manufacturer-specific RTSP URL patterns"""
-        try:
-            manufacturer_lower = manufacturer.lower()
-            
-            # Manufacturer-specific RTSP URL patterns
-            rtsp_patterns = {
-                'hikvision': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/Streaming/Channels/101',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/Streaming/Channels/102',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/h264/ch1/main/av_stream'
-                },
-                'dahua': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=1',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0'
-                },
-                'amcrest': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=1', 
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/cam/realmonitor?channel=1&subtype=0'
-                },
-                'reolink': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/h264Preview_01_main',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/h264Preview_01_sub',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/h264Preview_01_main'
-                },
-                'axis': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/axis-media/media.amp',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/axis-media/media.amp?resolution=320x240',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/axis-media/media.amp'
-                },
-                'foscam': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/videoMain',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/videoSub',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/videoMain'
-                },
-                'vivotek': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/live.sdp',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/live2.sdp',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/live.sdp'
-                },
-                'bosch': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/rtsp_tunnel',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/rtsp_tunnel?inst=2',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/rtsp_tunnel'
-                },
-                'sony': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video1',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video2', 
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/media/video1'
-                },
-                'uniview': {
-                    'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video1',
-                    'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/media/video2',
-                    'default': f'rtsp://{username}:{password}@{ip_address}:554/media/video1'
-                }
-            }
-            
-            # Check for exact manufacturer match
-            for mfr_key, patterns in rtsp_patterns.items():
-                if mfr_key in manufacturer_lower:
-                    return {
-                        'main_stream': patterns['main_stream'],
-                        'sub_stream': patterns['sub_stream'], 
-                        'default_url': patterns['default'],
-                        'manufacturer_detected': True,
-                        'alternative_urls': [patterns['main_stream'], patterns['sub_stream']]
-                    }
-            
-            # Generic fallback for unknown manufacturers
-            generic_patterns = [
-                f'rtsp://{username}:{password}@{ip_address}:554/stream1',
-                f'rtsp://{username}:{password}@{ip_address}:554/live',
-                f'rtsp://{username}:{password}@{ip_address}:554/media/video1'
-            ]
-            
-            return {
-                'main_stream': generic_patterns[0],
-                'sub_stream': generic_patterns[0],
-                'default_url': generic_patterns[0],
-                'manufacturer_detected': False,
-                'alternative_urls': generic_patterns
-            }
-            
-        except Exception:
-            # Ultimate fallback
-            return {
-                'main_stream': f'rtsp://{username}:{password}@{ip_address}:554/live',
-                'sub_stream': f'rtsp://{username}:{password}@{ip_address}:554/live',
-                'default_url': f'rtsp://{username}:{password}@{ip_address}:554/live',
-                'manufacturer_detected': False,
-                'alternative_urls': []
-            }
+        return build_urls(ip_address, manufacturer, username, password)
 
     def load_existing_cameras(self):
         """Load existing camera configurations from config.yaml if available"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(script_dir, "frigate", "config", "config.yaml")
+        config_path = _CONFIG_PATH
         
         if os.path.exists(config_path):
             try:
@@ -1454,9 +1299,9 @@ class SimpleCameraGUI(QWidget):
                     self.rebuild_camera_tabs(self.cams_count.value())
                     return
                 
-                # Try parsing with yaml.safe_load
+                # Try parsing the YAML
                 try:
-                    config = yaml.safe_load(config_content)
+                    config = yaml.load(config_content, Loader=CLoader)
                     if config is None:
                         config = {}
                 except yaml.YAMLError as yaml_error:
@@ -2340,11 +2185,11 @@ class SimpleCameraGUI(QWidget):
 
         # Load existing camera names from config if available
         camera_names = []
-        config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frigate", "config", "config.yaml")
+        config_path = _CONFIG_PATH
         if os.path.exists(config_path):
             try:
                 with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=CLoader)
                 if config and "cameras" in config:
                     camera_names = list(config["cameras"].keys())
             except:
@@ -3176,9 +3021,7 @@ class SimpleCameraGUI(QWidget):
         # PROCEED WITH SAVE (validation passed)
         # ================================
         
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        config_dir = os.path.join(script_dir, "frigate", "config")
-        config_path = os.path.join(config_dir, "config.yaml")
+        config_path = _CONFIG_PATH
         
         # Check if config.yaml exists
         if not os.path.exists(config_path):
@@ -3265,12 +3108,8 @@ class SimpleCameraGUI(QWidget):
             if hasattr(self, 'launcher_parent') and self.launcher_parent:
                 self.launcher_parent.suppress_config_change_popup = True
             
-            # Generate YAML string with spacing between cameras
-            yaml_content = yaml.dump(ordered_config, Dumper=MyDumper, default_flow_style=False, sort_keys=False)
-            yaml_content = MyDumper.add_camera_spacing(yaml_content)
-            
-            with open(config_path, 'w') as f:
-                f.write(yaml_content)
+            # The preserved sections are only replaced once the new YAML is fully written
+            save_yaml(ordered_config, config_path)
             
             # Mark as saved and close the GUI
             self.has_unsaved_changes = False
@@ -3315,7 +3154,7 @@ class SimpleCameraGUI(QWidget):
                 return {}
             
             try:
-                config = yaml.safe_load(config_content)
+                config = yaml.load(config_content, Loader=CLoader)
                 if config is None:
                     config = {}
                 return config
@@ -3396,7 +3235,7 @@ class SimpleCameraGUI(QWidget):
                         "enabled": True
                     },
                     "objects": {
-                        "track": [obj.strip() for obj in cam["objects"].toPlainText().split(',') if obj.strip()]
+                        "track": [obj for token in cam["objects"].toPlainText().split(',') if (obj := token.strip())]
                     },
                     "snapshots": {
                         "enabled": False,
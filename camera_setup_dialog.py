@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+"""
+Camera Setup Guide dialog for Frigate + MemryX
+Step-by-step help for connecting an IP camera, shown from the config GUI
+"""
+
+from PySide6.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                               QPushButton, QTextEdit, QScrollArea, QSizePolicy)
+from PySide6.QtGui import QTextDocument
+from PySide6.QtCore import Qt
+import os
+import functools
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_CAMERA_SETUP_HTML_PATH = os.path.join(_SCRIPT_DIR, "assets", "camera_setup.html")
+_camera_setup_doc = None
+
+@functools.lru_cache(maxsize=1)
+def _camera_setup_html():
+    """Read the camera setup guide HTML from assets (once per process)"""
+    with open(_CAMERA_SETUP_HTML_PATH, "r", encoding="utf-8") as f:
+        return f.read()
+
+def _camera_setup_document():
+    """Return the shared, already-parsed camera setup guide document"""
+    global _camera_setup_doc
+    if _camera_setup_doc is None:
+        # No parent: QTextEdit.setDocument() doesn't take ownership, so the
+        # document outlives every dialog that displays it
+        _camera_setup_doc = QTextDocument()
+        _camera_setup_doc.setHtml(_camera_setup_html())
+    return _camera_setup_doc
+
+# --- Camera Setup Guide dialog stylesheet ---
+# Applied once on the dialog; each section is targeted by object name
+_SETUP_DIALOG_QSS = """
+#setupHeader {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+        stop:0 #3498db, stop:1 #2980b9);
+    border-radius: 0px;
+}
+#setupTitle {
+    color: white;
+    font-size: 24px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    background: transparent;
+}
+#setupSubtitle {
+    color: rgba(255, 255, 255, 0.9);
+    font-size: 14px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    background: transparent;
+    margin-top: 5px;
+}
+#setupScroll {
+    border: none;
+    background-color: white;
+}
+#setupScroll QScrollBar:vertical {
+    background-color: #f0f0f0;
+    width: 12px;
+    border-radius: 6px;
+}
+#setupScroll QScrollBar::handle:vertical {
+    background-color: #3498db;
+    border-radius: 6px;
+    min-height: 20px;
+}
+#setupScroll QScrollBar::handle:vertical:hover {
+    background-color: #2980b9;
+}
+#setupText {
+    border: none;
+    background-color: white;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 14px;
+    line-height: 1.6;
+    padding: 20px;
+}
+#setupFooter {
+    background-color: #f8f9fa;
+    border-top: 1px solid #e9ecef;
+}
+#setupCloseButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+        stop:0 #3498db, stop:1 #2980b9);
+    color: white;
+    padding: 12px 30px;
+    border: none;
+    border-radius: 6px;
+    font-size: 14px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+#setupCloseButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+        stop:0 #2980b9, stop:1 #1f618d);
+}
+#setupCloseButton:pressed {
+    background: #1f618d;
+}
+"""
+
+class CameraSetupDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("📖 Camera Setup Guide - Frigate + MemryX")
+        self.setModal(True)
+        self.setStyleSheet(_SETUP_DIALOG_QSS)
+        
+        # Set window properties - make responsive
+        self.setMinimumSize(600, 400)  # Smaller minimum size
+        self.resize(1000, 850)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        
+        # Main layout with scroll area for responsive design
+        main_scroll = QScrollArea()
+        main_scroll.setWidgetResizable(True)
+        main_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        main_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        
+        scroll_content = QWidget()
+        layout = QVBoxLayout(scroll_content)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+        
+        main_scroll.setWidget(scroll_content)
+        
+        # Main dialog layout
+        dialog_layout = QVBoxLayout(self)
+        dialog_layout.setContentsMargins(0, 0, 0, 0)
+        dialog_layout.addWidget(main_scroll)
+        
+        # Header section
+        header_widget = QWidget()
+        header_widget.setObjectName("setupHeader")
+        header_layout = QVBoxLayout(header_widget)
+        header_layout.setContentsMargins(20, 15, 20, 15)
+        
+        # Title
+        title_label = QLabel("🎥 Camera Setup Guide")
+        title_label.setObjectName("setupTitle")
+        title_label.setAlignment(Qt.AlignCenter)
+        
+        # Subtitle
+        subtitle_label = QLabel("Learn how to connect and configure your IP camera for Frigate + MemryX")
+        subtitle_label.setObjectName("setupSubtitle")
+        subtitle_label.setAlignment(Qt.AlignCenter)
+        subtitle_label.setWordWrap(True)
+        
+        header_layout.addWidget(title_label)
+        header_layout.addWidget(subtitle_label)
+        
+        # Content area with scroll
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        scroll_area.setObjectName("setupScroll")
+        
+        # Create text area with HTML content
+        self.text_area = QTextEdit()
+        self.text_area.setReadOnly(True)
+        self.text_area.setObjectName("setupText")
+        
+        # The guide is parsed once per process and shared between dialog opens
+        self.text_area.setDocument(_camera_setup_document())
+        scroll_area.setWidget(self.text_area)
+        
+        # Footer with buttons
+        footer_widget = QWidget()
+        footer_widget.setObjectName("setupFooter")
+        footer_layout = QHBoxLayout(footer_widget)
+        footer_layout.setContentsMargins(20, 15, 20, 15)
+        
+        # Close button
+        close_btn = QPushButton("✓ Got it!")
+        close_btn.setObjectName("setupCloseButton")
+        close_btn.clicked.connect(self.accept)
+        
+        footer_layout.addStretch()
+        footer_layout.addWidget(close_btn)
+        
+        # Add all sections to main layout
+        layout.addWidget(header_widget)
+        layout.addWidget(scroll_area, 1)  # Give scroll area most space
+        layout.addWidget(footer_widget)
+        
+        self.setLayout(layout)
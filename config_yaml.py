@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+"""
+config.yaml formatting for Frigate + MemryX
+YAML dumper and blank-line spacing shared by the camera and config GUIs
+"""
+
+import os
+import re
+import tempfile
+
+import yaml
+
+# libyaml's C emitter is several times faster than the pure-Python one;
+# fall back to SafeDumper when PyYAML was built without it.
+BaseDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# First characters of a dumped line that is not a top-level key (indented
+# content or a block-sequence item)
+_NESTED_LINE_START = frozenset(' \t-')
+# A line break that ends a non-empty line and is followed by a top-level key
+_TOP_LEVEL_BREAK_RE = re.compile(r'(?<=[^\n])\n(?=[^ \t\n-])')
+
+class CameraSpacingWriter:
+    """File-like wrapper that adds a blank line between top-level keys and
+    between camera entries while the YAML is being emitted.
+
+    The C emitter never calls back into Python (write_line_break etc.), so the
+    spacing is applied to its output stream one line at a time instead of
+    re-splitting the finished dump.
+    """
+
+    # Blank line before every top-level key; pass toplevel_spacing=False for
+    # output that is only read back by code and never by a person
+    TOPLEVEL_SPACING = True
+
+    def __init__(self, stream, toplevel_spacing=None):
+        self._stream_write = stream.write
+        self._toplevel_spacing = (self.TOPLEVEL_SPACING if toplevel_spacing is None
+                                  else toplevel_spacing)
+        self._partial = ''
+        self._prev = None  # last line written, None before the first one
+        self._in_cameras_section = False
+        # Once the cameras section is behind us only top-level keys need spacing
+        self._cameras_done = False
+        self._camera_indent = None  # leading spaces of a camera entry line
+        self._camera_depth = 0
+
+    def write(self, data):
+        text = self._partial + data
+        end = text.rfind('\n') + 1
+        self._partial = text[end:]
+        if not end:
+            return
+        if self._cameras_done:
+            if self._toplevel_spacing:
+                self._write_top_level_spacing(text[:end])
+            else:
+                self._stream_write(text[:end])
+            return
+        # Most lines pass through unchanged, so rather than rebuilding the
+        # chunk line by line, cut it where blank lines go and re-join those
+        # few slices with a newline
+        block = text[:end]
+        pieces = []
+        start = pos = 0
+        for line in block[:-1].split('\n'):
+            if self._needs_blank_line(line):
+                pieces.append(block[start:pos])
+                start = pos
+            pos += len(line) + 1
+        pieces.append(block[start:])
+        self._stream_write('\n'.join(pieces))
+
+    def close(self):
+        """Flush any trailing text not terminated by a newline"""
+        if self._partial:
+            if self._needs_blank_line(self._partial):
+                self._stream_write('\n')
+            self._stream_write(self._partial)
+            self._partial = ''
+
+    def _write_top_level_spacing(self, block):
+        """Write complete lines that only need blank lines before top-level keys"""
+        if self._prev and block[0] != '\n' and block[0] not in _NESTED_LINE_START:
+            self._stream_write('\n')
+        self._stream_write(_TOP_LEVEL_BREAK_RE.sub('\n\n', block))
+        self._prev = block[block.rfind('\n', 0, -1) + 1:-1]
+
+    def _needs_blank_line(self, line):
+        """Advance the section state by one line; True if a blank line goes before it"""
+        blank = False
+        if line and line[0] not in _NESTED_LINE_START:
+            # New top-level key: separate it from the previous section and
+            # track whether we're entering (or leaving) the cameras section
+            blank = self._toplevel_spacing and bool(self._prev)
+            if self._in_cameras_section:
+                self._cameras_done = True
+            self._in_cameras_section = line.rstrip().endswith('cameras:')
+            self._camera_indent = None
+        elif self._in_cameras_section and line:
+            # Determine camera entry indent level (first camera sets the pattern)
+            if self._camera_indent is None:
+                leading = len(line) - len(line.lstrip(' '))
+                if leading and ':' in line:
+                    self._camera_indent = ' ' * leading
+                    self._camera_depth = leading
+            
+            # Add blank line before each camera entry (exactly the first camera's
+            # indent). The one-character slice rejects deeper lines cheaply
+            # before the prefix compare; neither allocates a new indent string.
+            depth = self._camera_depth
+            blank = (self._camera_indent is not None and line[depth:depth + 1] != ' '
+                     and line.startswith(self._camera_indent) and line.endswith(':')
+                     and bool(self._prev))
+        self._prev = line
+        return blank
+
+class MyDumper(BaseDumper):
+    # The C emitter never calls back into Python (write_line_break etc.),
+    # so all blank-line formatting is applied by CameraSpacingWriter.
+    pass
+
+def save_yaml(data, path):
+    """Write data to path as spaced-out YAML.
+
+    The dump is streamed into a temporary file next to path, which then
+    replaces it, so a dump that fails partway leaves the existing file as it was.
+    """
+    tmp = tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), prefix=".config-",
+                                      suffix=".yaml", delete=False)
+    try:
+        with tmp:
+            writer = CameraSpacingWriter(tmp)
+            yaml.dump(data, writer, Dumper=MyDumper, default_flow_style=False, sort_keys=False)
+            writer.close()
+        # The temporary file is private to this user; give it the permissions
+        # the config had (or a new file would have got) before it takes over
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+"""
+RTSP URL patterns for Frigate + MemryX
+Manufacturer-specific stream URLs shared by the camera and config GUIs
+"""
+
+# Stream paths (main, sub, default) behind rtsp://user:password@ip:554 for
+# each manufacturer, matched in this order against the lower-cased name
+RTSP_PATHS = {
+    'hikvision': ('/Streaming/Channels/101', '/Streaming/Channels/102', '/h264/ch1/main/av_stream'),
+    'dahua': ('/cam/realmonitor?channel=1&subtype=0', '/cam/realmonitor?channel=1&subtype=1', '/cam/realmonitor?channel=1&subtype=0'),
+    'amcrest': ('/cam/realmonitor?channel=1&subtype=0', '/cam/realmonitor?channel=1&subtype=1', '/cam/realmonitor?channel=1&subtype=0'),
+    'reolink': ('/h264Preview_01_main', '/h264Preview_01_sub', '/h264Preview_01_main'),
+    'axis': ('/axis-media/media.amp', '/axis-media/media.amp?resolution=320x240', '/axis-media/media.amp'),
+    'foscam': ('/videoMain', '/videoSub', '/videoMain'),
+    'vivotek': ('/live.sdp', '/live2.sdp', '/live.sdp'),
+    'bosch': ('/rtsp_tunnel', '/rtsp_tunnel?inst=2', '/rtsp_tunnel'),
+    'sony': ('/media/video1', '/media/video2', '/media/video1'),
+    'uniview': ('/media/video1', '/media/video2', '/media/video1'),
+}
+# Paths tried for cameras from any other manufacturer
+GENERIC_RTSP_PATHS = ('/stream1', '/live', '/media/video1')
+
+def build_urls(ip_address, manufacturer, username="admin", password="password"):
+    """Generate manufacturer-specific RTSP URL patterns"""
+    base_url = f'rtsp://{username}:{password}@{ip_address}:554'
+    try:
+        manufacturer_lower = manufacturer.lower()
+    except AttributeError:
+        # Ultimate fallback
+        live_url = base_url + '/live'
+        return {
+            'main_stream': live_url,
+            'sub_stream': live_url,
+            'default_url': live_url,
+            'manufacturer_detected': False,
+            'alternative_urls': []
+        }
+
+    # Check for exact manufacturer match
+    for mfr_key, (main_path, sub_path, default_path) in RTSP_PATHS.items():
+        if mfr_key in manufacturer_lower:
+            return {
+                'main_stream': base_url + main_path,
+                'sub_stream': base_url + sub_path,
+                'default_url': base_url + default_path,
+                'manufacturer_detected': True,
+                'alternative_urls': [base_url + main_path, base_url + sub_path]
+            }
+
+    # Generic fallback for unknown manufacturers
+    generic_patterns = [base_url + path for path in GENERIC_RTSP_PATHS]
+    return {
+        'main_stream': generic_patterns[0],
+        'sub_stream': generic_patterns[0],
+        'default_url': generic_patterns[0],
+        'manufacturer_detected': False,
+        'alternative_urls': generic_patterns
+    }